@@ -55,6 +55,12 @@ SUPPORTED_PROVIDERS = (
 SUPPORTED_PROVIDER_NAMES = [provider.get_provider_type() for provider in SUPPORTED_PROVIDERS]
 SUPPORTED_ORGANIZER_EMAILS = [provider.get_default_organizer() for provider in SUPPORTED_PROVIDERS]
 
+# Index of the supported Providers by their lowercase provider type
+_PROVIDERS_BY_TYPE = {provider.get_provider_type(): provider for provider in SUPPORTED_PROVIDERS}
+# Index of the supported Providers by their default organizer. Reversed, so when several Providers share the same
+#   organizer, the first one in SUPPORTED_PROVIDERS is the one used.
+_PROVIDERS_BY_ORGANIZER = {provider.get_default_organizer(): provider for provider in reversed(SUPPORTED_PROVIDERS)}
+
 
 def init_provider(provider_type=None) -> Optional[GenericProvider]:
     """Returns an instance of the corresponding Notification Provider."""
@@ -70,32 +76,28 @@ def init_provider(provider_type=None) -> Optional[GenericProvider]:
 
 def get_provider_class(provider_name: str) -> Type[GenericProvider]:
     """Returns the Provider parser class for a specific provider_type."""
-    provider_name = provider_name.lower()
+    if provider_name in _PROVIDERS_BY_TYPE:
+        # Provider types are usually already lowercase, so the conversion is only done when needed
+        return _PROVIDERS_BY_TYPE[provider_name]
 
-    for provider_parser in SUPPORTED_PROVIDERS:
-        if provider_parser.get_provider_type() == provider_name:
-            break
-    else:
+    provider_name = provider_name.lower()
 
+    try:
+        return _PROVIDERS_BY_TYPE[provider_name]
+    except KeyError:
         raise NonexistentProviderError(
             f"{provider_name} is not a currently supported provider. Only {', '.join(SUPPORTED_PROVIDER_NAMES)}"
-        )
-
-    return provider_parser
+        ) from None
 
 
 def get_provider_class_from_sender(email_sender: str) -> Type[GenericProvider]:
     """Returns the notification parser class for an email sender address."""
-
-    for provider_parser in SUPPORTED_PROVIDERS:
-        if provider_parser.get_default_organizer() == email_sender:
-            break
-    else:
+    try:
+        return _PROVIDERS_BY_ORGANIZER[email_sender]
+    except KeyError:
         raise NonexistentProviderError(
             f"{email_sender} is not a currently supported provider parser. Only {', '.join(SUPPORTED_ORGANIZER_EMAILS)}"
-        )
-
-    return provider_parser
+        ) from None
 
 
 __all__ = [
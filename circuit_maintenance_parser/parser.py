@@ -104,45 +104,49 @@ class ICal(Parser):
     def parse_ical(gcal: Calendar) -> List[Dict]:
         """Standard ICalendar parsing."""
         result = []
-        for component in gcal.walk():
-            if component.name == "VEVENT":
-                data = {
-                    "provider": str(component.get("X-MAINTNOTE-PROVIDER")),
-                    "account": str(component.get("X-MAINTNOTE-ACCOUNT")),
-                    "maintenance_id": str(component.get("X-MAINTNOTE-MAINTENANCE-ID")),
-                    # status may be omitted, per the BCOP
-                    "status": Status(component.get("X-MAINTNOTE-STATUS", "NO-CHANGE")),
-                    "start": round(component.get("DTSTART").dt.timestamp()),
-                    "end": round(component.get("DTEND").dt.timestamp()),
-                    "stamp": round(component.get("DTSTAMP").dt.timestamp()),
-                    "summary": str(component.get("SUMMARY")),
-                    "organizer": str(component.get("ORGANIZER")),
-                    "uid": str(component.get("UID")),
-                    # per the BCOP sequence is mandatory, but we have real examples where it's omitted,
-                    # usually in combination with an omitted status. In that case let's treat the sequence as -1,
-                    # i.e. older than all known updates.
-                    "sequence": int(component.get("SEQUENCE", -1)),
-                }
-
-                data = {key: value for key, value in data.items() if value != "None"}
-
-                # In a VEVENT sometimes there are mutliple object ID with custom impacts
-                circuits = component.get("X-MAINTNOTE-OBJECT-ID")
-                if isinstance(circuits, list):
-                    data["circuits"] = [
-                        CircuitImpact(
-                            circuit_id=str(object),
-                            impact=Impact(
-                                object.params.get("X-MAINTNOTE-OBJECT-IMPACT", component.get("X-MAINTNOTE-IMPACT"))
-                            ),
-                        )
-                        for object in component.get("X-MAINTNOTE-OBJECT-ID")
-                    ]
-                else:
-                    data["circuits"] = [
-                        CircuitImpact(circuit_id=circuits, impact=Impact(component.get("X-MAINTNOTE-IMPACT")),)
-                    ]
-                result.append(data)
+        for component in gcal.walk("VEVENT"):
+            # Fail early with a meaningful error instead of an AttributeError when any mandatory date is missing
+            for date_property in ("DTSTART", "DTEND", "DTSTAMP"):
+                if date_property not in component:
+                    raise ParserError(f"Missing mandatory {date_property} property in VEVENT")
+
+            data = {
+                "provider": str(component.get("X-MAINTNOTE-PROVIDER")),
+                "account": str(component.get("X-MAINTNOTE-ACCOUNT")),
+                "maintenance_id": str(component.get("X-MAINTNOTE-MAINTENANCE-ID")),
+                # status may be omitted, per the BCOP
+                "status": Status(component.get("X-MAINTNOTE-STATUS", "NO-CHANGE")),
+                "start": round(component.get("DTSTART").dt.timestamp()),
+                "end": round(component.get("DTEND").dt.timestamp()),
+                "stamp": round(component.get("DTSTAMP").dt.timestamp()),
+                "summary": str(component.get("SUMMARY")),
+                "organizer": str(component.get("ORGANIZER")),
+                "uid": str(component.get("UID")),
+                # per the BCOP sequence is mandatory, but we have real examples where it's omitted,
+                # usually in combination with an omitted status. In that case let's treat the sequence as -1,
+                # i.e. older than all known updates.
+                "sequence": int(component.get("SEQUENCE", -1)),
+            }
+
+            data = {key: value for key, value in data.items() if value != "None"}
+
+            # In a VEVENT sometimes there are mutliple object ID with custom impacts
+            circuits = component.get("X-MAINTNOTE-OBJECT-ID")
+            if isinstance(circuits, list):
+                data["circuits"] = [
+                    CircuitImpact(
+                        circuit_id=str(object),
+                        impact=Impact(
+                            object.params.get("X-MAINTNOTE-OBJECT-IMPACT", component.get("X-MAINTNOTE-IMPACT"))
+                        ),
+                    )
+                    for object in component.get("X-MAINTNOTE-OBJECT-ID")
+                ]
+            else:
+                data["circuits"] = [
+                    CircuitImpact(circuit_id=circuits, impact=Impact(component.get("X-MAINTNOTE-IMPACT")),)
+                ]
+            result.append(data)
         return result
 
 
@@ -94,9 +94,9 @@ class GenericProcessor(BaseModel, extra=Extra.forbid):
 
     def extend_processor_data(self, current_maintenance_data):
         """Method used to extend Maintenance data with some defaults."""
-        temp_res = current_maintenance_data.copy()
-        current_maintenance_data.update(self.extended_data)
-        current_maintenance_data.update(temp_res)
+        # Data already present takes precedence over the defaults
+        for key, value in self.extended_data.items():
+            current_maintenance_data.setdefault(key, value)
 
 
 class SimpleProcessor(GenericProcessor):
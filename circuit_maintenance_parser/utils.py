@@ -31,9 +31,12 @@ class classproperty:  # pylint: disable=invalid-name,too-few-public-methods
 class Geolocator:
     """Class to obtain Geo Location coordinates."""
 
-    # Keeping caching of local DB and timezone in the class
+    # Keeping caching of local DB, timezone and resolved cities in the class
     _db_location: Dict[Union[Tuple[str, str], str], Tuple[float, float]] = {}
     _timezone = None
+    _city_timezones: Dict[str, str] = {}
+    # Cities come from the notifications content, so the resolved ones cache is bounded
+    _city_timezones_max_size = 4096
 
     @classproperty
     def timezone(cls):  # pylint: disable=no-self-argument
@@ -71,8 +74,9 @@ class Geolocator:
 
     def get_location_from_local_file(self, city: str) -> Tuple[float, float]:
         """Get location from Local DB."""
-        city_name = city.split(", ")[0]
-        country = city.split(", ")[-1]
+        city_parts = city.split(", ")
+        city_name = city_parts[0]
+        country = city_parts[-1]
 
         lat, lng = self.db_location.get(  # pylint: disable=no-member
             (city_name, country), self.db_location.get(city_name, (None, None))  # pylint: disable=no-member
@@ -101,6 +105,9 @@ class Geolocator:
         Args:
             city (str): Geographic location name
         """
+        if city in self._city_timezones:
+            return self._city_timezones[city]
+
         if self.timezone is not None:
             try:
                 latitude, longitude = self.get_location(city)
@@ -113,6 +120,10 @@ class Geolocator:
 
                 if timezone:
                     logger.debug("Matched city %s to timezone %s", city, timezone)
+                    if len(self._city_timezones) >= self._city_timezones_max_size:
+                        # Evict the oldest resolved city
+                        del self._city_timezones[next(iter(self._city_timezones))]
+                    self._city_timezones[city] = timezone
                     return timezone
             except Exception as exc:
                 logger.error("Cannot obtain the timezone for city %s: %s", city, exc)
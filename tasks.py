@@ -116,7 +116,7 @@ def pytest(context, local=INVOKE_LOCAL):
         context (obj): Used to run specific commands
         local (bool): Define as `True` to execute locally
     """
-    exec_cmd = "pytest"
+    exec_cmd = "pytest --durations=10"
     run_cmd(context, exec_cmd, local)
 
 
@@ -1,6 +1,17 @@
 """Used to setup fixtures to be used through tests"""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import pytest
 
+from .helpers import DATA_PATH
+
+
+def pytest_collection_finish(session):  # pylint: disable=unused-argument
+    """Reads all the test data files once after collection, so the tests don't hit a cold disk cache."""
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(Path.read_bytes, (path for path in DATA_PATH.rglob("*") if path.is_file())))
+
 
 @pytest.fixture()
 def maintenance_data():
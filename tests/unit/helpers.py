@@ -0,0 +1,17 @@
+"""Helpers shared by the unit tests."""
+from functools import lru_cache
+from pathlib import Path
+
+DATA_PATH = Path(__file__).parent / "data"
+
+
+@lru_cache(maxsize=None)
+def read_data_file(data_file):
+    """Returns the content of a test data file, reading it only once as it's shared by multiple test cases."""
+    return (DATA_PATH / data_file).read_bytes()
+
+
+@lru_cache(maxsize=None)
+def get_instance(class_):
+    """Returns an instance of a Provider or Parser class, shared by all the test cases as they don't keep any state."""
+    return class_()
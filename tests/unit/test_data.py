@@ -1,12 +1,9 @@
 """Tests NotificationData."""
-import os
-from pathlib import Path
 import email
 
 from circuit_maintenance_parser.data import NotificationData
 
-
-dir_path = os.path.dirname(os.path.realpath(__file__))
+from .helpers import DATA_PATH
 
 
 def test_init_from_raw():
@@ -26,8 +23,7 @@ def test_init_from_raw_with_issue():
 
 def test_init_from_email_bytes():
     """Test the email data load."""
-    with open(Path(dir_path, "data", "email", "test_sample_message.eml"), "rb") as email_file:
-        email_raw_data = email_file.read()
+    email_raw_data = (DATA_PATH / "email" / "test_sample_message.eml").read_bytes()
     data = NotificationData.init_from_email_bytes(email_raw_data)
     assert isinstance(data, NotificationData)
     assert len(data.data_parts) == 5
@@ -41,10 +37,8 @@ def test_init_from_email_with_issue():
 
 def test_init_from_emailmessage():
     """Test the emailmessage data load."""
-    with open(Path(dir_path, "data", "email", "test_sample_message.eml"), "rb") as email_file:
-        email_raw_data = email_file.read()
-    raw_email_string = email_raw_data.decode("utf-8")
-    email_message = email.message_from_string(raw_email_string)
+    email_raw_data = (DATA_PATH / "email" / "test_sample_message.eml").read_bytes()
+    email_message = email.message_from_bytes(email_raw_data)
     data = NotificationData.init_from_emailmessage(email_message)
     assert isinstance(data, NotificationData)
     assert len(data.data_parts) == 5
@@ -1,6 +1,6 @@
 """Tests for End to End library usage."""
 import json
-import os
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -34,525 +34,291 @@ from circuit_maintenance_parser.provider import (
     Zayo,
 )
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
+from .helpers import get_instance, read_data_file
 
-GENERIC_ICAL_DATA_PATH = Path(dir_path, "data", "ical", "ical1")
-GENERIC_ICAL_RESULT_PATH = Path(dir_path, "data", "ical", "ical1_result.json")
+GENERIC_ICAL_DATA_PATH = "ical/ical1"
+GENERIC_ICAL_RESULT_PATH = "ical/ical1_result.json"
+# Email header data shared by multiple test cases
+EMAIL_DATE_DATA = (EMAIL_HEADER_DATE, "date/email_date_1")
+EMAIL_DATE_RESULT_PATH = "date/email_date_1_result.json"
+LUMEN_SUBJECT_DATA = (EMAIL_HEADER_SUBJECT, "lumen/subject_work_planned")
 
+# Maintenance data not present in the notifications that is filled by default
+DEFAULT_MAINTENANCE_DATA = {"uid": "0", "sequence": 1, "summary": ""}
 
-@pytest.mark.parametrize(
-    "provider_class, test_data_files, result_parse_files",
-    [
-        # GenericProvider
-        (GenericProvider, [("ical", GENERIC_ICAL_DATA_PATH),], [GENERIC_ICAL_RESULT_PATH,],),
-        # AquaComms
-        (
-            AquaComms,
-            [("email", Path(dir_path, "data", "aquacomms", "aquacomms1.eml")),],
-            [Path(dir_path, "data", "aquacomms", "aquacomms1_result.json"),],
-        ),
-        # AWS
-        (
-            AWS,
-            [("email", Path(dir_path, "data", "aws", "aws1.eml")),],
-            [Path(dir_path, "data", "aws", "aws1_result.json"),],
-        ),
-        (
-            AWS,
-            [("email", Path(dir_path, "data", "aws", "aws2.eml")),],
-            [Path(dir_path, "data", "aws", "aws2_result.json"),],
-        ),
-        # Cogent
-        (
-            Cogent,
-            [
-                ("html", Path(dir_path, "data", "cogent", "cogent1.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "cogent", "cogent1_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        (
-            Cogent,
-            [
-                ("html", Path(dir_path, "data", "cogent", "cogent2.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "cogent", "cogent2_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        # Colt
-        (
-            Colt,
-            [("email", Path(dir_path, "data", "colt", "colt3.eml")),],
-            [Path(dir_path, "data", "colt", "colt3_result.json"),],
-        ),
-        (
-            Colt,
-            [("email", Path(dir_path, "data", "colt", "colt4.eml")),],
-            [Path(dir_path, "data", "colt", "colt4_result.json"),],
-        ),
-        (
-            Colt,
-            [("email", Path(dir_path, "data", "colt", "colt5.eml")),],
-            [Path(dir_path, "data", "colt", "colt5_result.json"),],
-        ),
-        # Equinix
-        (
-            Equinix,
-            [("email", Path(dir_path, "data", "equinix", "equinix1.eml"))],
-            [Path(dir_path, "data", "equinix", "equinix1_result_combined.json")],
-        ),
-        (
-            Equinix,
-            [("email", Path(dir_path, "data", "equinix", "equinix3.eml"))],
-            [Path(dir_path, "data", "equinix", "equinix3_result_combined.json")],
-        ),
-        (
-            Equinix,
-            [("email", Path(dir_path, "data", "equinix", "equinix4.eml"))],
-            [Path(dir_path, "data", "equinix", "equinix4_result_combined.json")],
-        ),
-        # EUNetworks
-        (EUNetworks, [("ical", GENERIC_ICAL_DATA_PATH),], [GENERIC_ICAL_RESULT_PATH,],),
-        # EXA / GTT
-        (
-            GTT,
-            [
-                ("html", Path(dir_path, "data", "gtt", "gtt1.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-                (EMAIL_HEADER_SUBJECT, Path(dir_path, "data", "gtt", "gtt1_email_subject")),
-            ],
-            [
-                Path(dir_path, "data", "gtt", "gtt1_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        (
-            GTT,
-            [
-                ("html", Path(dir_path, "data", "gtt", "gtt2.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-                (EMAIL_HEADER_SUBJECT, Path(dir_path, "data", "gtt", "gtt2_email_subject")),
-            ],
-            [
-                Path(dir_path, "data", "gtt", "gtt2_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        (
-            GTT,
-            [
-                ("html", Path(dir_path, "data", "gtt", "gtt3.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-                (EMAIL_HEADER_SUBJECT, Path(dir_path, "data", "gtt", "gtt3_email_subject")),
-            ],
-            [
-                Path(dir_path, "data", "gtt", "gtt3_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        (
-            GTT,
-            [
-                ("html", Path(dir_path, "data", "gtt", "gtt4.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-                (EMAIL_HEADER_SUBJECT, Path(dir_path, "data", "gtt", "gtt4_email_subject")),
-            ],
-            [
-                Path(dir_path, "data", "gtt", "gtt4_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        (
-            GTT,
-            [
-                ("html", Path(dir_path, "data", "gtt", "gtt5.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-                (EMAIL_HEADER_SUBJECT, Path(dir_path, "data", "gtt", "gtt5_email_subject")),
-            ],
-            [
-                Path(dir_path, "data", "gtt", "gtt5_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        (
-            GTT,
-            [
-                ("html", Path(dir_path, "data", "gtt", "gtt6.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-                (EMAIL_HEADER_SUBJECT, Path(dir_path, "data", "gtt", "gtt6_email_subject")),
-            ],
-            [
-                Path(dir_path, "data", "gtt", "gtt6_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        (
-            GTT,
-            [("email", Path(dir_path, "data", "gtt", "gtt7.eml")),],
-            [Path(dir_path, "data", "gtt", "gtt7_result.json"),],
-        ),
-        # HGC
-        (
-            HGC,
-            [
-                ("email", Path(dir_path, "data", "hgc", "hgc1.eml")),
-                ("email", Path(dir_path, "data", "hgc", "hgc2.eml")),
-            ],
-            [Path(dir_path, "data", "hgc", "hgc1_result.json"), Path(dir_path, "data", "hgc", "hgc2_result.json"),],
-        ),
-        # Lumen
-        (
-            Lumen,
-            [
-                ("html", Path(dir_path, "data", "lumen", "lumen1.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-                (EMAIL_HEADER_SUBJECT, Path(dir_path, "data", "lumen", "subject_work_planned")),
-            ],
-            [
-                Path(dir_path, "data", "lumen", "lumen1_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        (
-            Lumen,
-            [
-                ("html", Path(dir_path, "data", "lumen", "lumen2.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-                (EMAIL_HEADER_SUBJECT, Path(dir_path, "data", "lumen", "subject_work_planned")),
-            ],
-            [
-                Path(dir_path, "data", "lumen", "lumen2_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        (
-            Lumen,
-            [
-                ("html", Path(dir_path, "data", "lumen", "lumen3.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-                (EMAIL_HEADER_SUBJECT, Path(dir_path, "data", "lumen", "subject_work_planned")),
-            ],
-            [
-                Path(dir_path, "data", "lumen", "lumen3_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        (
-            Lumen,
-            [
-                ("html", Path(dir_path, "data", "lumen", "lumen4.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-                (EMAIL_HEADER_SUBJECT, Path(dir_path, "data", "lumen", "subject_work_planned")),
-            ],
-            [
-                Path(dir_path, "data", "lumen", "lumen4_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        # Megaport
-        (
-            Megaport,
-            [
-                ("html", Path(dir_path, "data", "megaport", "megaport1.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "megaport", "megaport1_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        (
-            Megaport,
-            [
-                ("html", Path(dir_path, "data", "megaport", "megaport2.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "megaport", "megaport2_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
-        ),
-        # Momentum
-        (
-            Momentum,
-            [("email", Path(dir_path, "data", "momentum", "momentum1.eml")),],
-            [Path(dir_path, "data", "momentum", "momentum1_result.json"),],
-        ),
-        # NTT
-        (
-            NTT,
-            [("ical", Path(dir_path, "data", "ntt", "ntt1")),],
-            [Path(dir_path, "data", "ntt", "ntt1_result.json"),],
-        ),
-        (NTT, [("ical", GENERIC_ICAL_DATA_PATH),], [GENERIC_ICAL_RESULT_PATH,],),
-        # PacketFabric
-        (PacketFabric, [("ical", GENERIC_ICAL_DATA_PATH),], [GENERIC_ICAL_RESULT_PATH,],),
-        # Seaborn
-        (
-            Seaborn,
-            [("email", Path(dir_path, "data", "seaborn", "seaborn1.eml")),],
-            [Path(dir_path, "data", "seaborn", "seaborn1_result.json"),],
-        ),
-        (
-            Seaborn,
-            [("email", Path(dir_path, "data", "seaborn", "seaborn2.eml")),],
-            [Path(dir_path, "data", "seaborn", "seaborn2_result.json"),],
-        ),
+
+@lru_cache(maxsize=None)
+def _init_notification_data(data_type, data_file):
+    """Returns the NotificationData initialized from a test data file, parsing each file only once.
+
+    The returned instance is shared, so its data_parts must be copied before adding new ones.
+    """
+    if data_type in ["ical", "html"]:
+        return NotificationData.init_from_raw(data_type, read_data_file(data_file))
+    if data_type in ["email"]:
+        return NotificationData.init_from_email_bytes(read_data_file(data_file))
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_extended_data(provider_class):
+    """Returns the extended data of a Provider class, computed once per class."""
+    return provider_class.get_extended_data()
+
+
+def _load_expected_result(result_parse_files):
+    """Returns the expected Maintenances data combining the partial results of multiple files.
+
+    The first file contains the data for each expected Maintenance, and any extra file (e.g. the email date) contains a
+    single partial result that completes the first Maintenance.
+    """
+    expected_result = []
+    for result_parse_file in result_parse_files:
+        partial_result_data = json.loads(read_data_file(result_parse_file))
+        if not expected_result:
+            expected_result = partial_result_data
+        else:
+            assert len(partial_result_data) == 1, f"{result_parse_file} should contain a single partial result"
+            expected_result[0].update(partial_result_data[0])
+
+    return expected_result
+
+
+# Test cases for each Provider, defined by the data files that compose the notification and the expected results
+PROVIDER_TEST_CASES = {
+    AquaComms: [([("email", "aquacomms/aquacomms1.eml")], ["aquacomms/aquacomms1_result.json"])],
+    AWS: [
+        ([("email", "aws/aws1.eml")], ["aws/aws1_result.json"]),
+        ([("email", "aws/aws2.eml")], ["aws/aws2_result.json"]),
+    ],
+    Cogent: [
+        ([("html", "cogent/cogent1.html"), EMAIL_DATE_DATA], ["cogent/cogent1_result.json", EMAIL_DATE_RESULT_PATH]),
+        ([("html", "cogent/cogent2.html"), EMAIL_DATE_DATA], ["cogent/cogent2_result.json", EMAIL_DATE_RESULT_PATH]),
+    ],
+    Colt: [
+        ([("email", "colt/colt3.eml")], ["colt/colt3_result.json"]),
+        ([("email", "colt/colt4.eml")], ["colt/colt4_result.json"]),
+        ([("email", "colt/colt5.eml")], ["colt/colt5_result.json"]),
+    ],
+    Equinix: [
+        ([("email", "equinix/equinix1.eml")], ["equinix/equinix1_result_combined.json"]),
+        ([("email", "equinix/equinix3.eml")], ["equinix/equinix3_result_combined.json"]),
+        ([("email", "equinix/equinix4.eml")], ["equinix/equinix4_result_combined.json"]),
+    ],
+    GTT: [
         (
-            Seaborn,
-            [("email", Path(dir_path, "data", "seaborn", "seaborn3.eml")),],
-            [Path(dir_path, "data", "seaborn", "seaborn3_result.json"),],
+            [("html", "gtt/gtt1.html"), EMAIL_DATE_DATA, (EMAIL_HEADER_SUBJECT, "gtt/gtt1_email_subject")],
+            ["gtt/gtt1_result.json", EMAIL_DATE_RESULT_PATH],
         ),
-        # Sparkle
         (
-            Sparkle,
-            [("email", Path(dir_path, "data", "sparkle", "sparkle1.eml")),],
-            [Path(dir_path, "data", "sparkle", "sparkle1_result.json"),],
+            [("html", "gtt/gtt2.html"), EMAIL_DATE_DATA, (EMAIL_HEADER_SUBJECT, "gtt/gtt2_email_subject")],
+            ["gtt/gtt2_result.json", EMAIL_DATE_RESULT_PATH],
         ),
-        # Telia
         (
-            Telia,
-            [("ical", Path(dir_path, "data", "telia", "telia1")),],
-            [Path(dir_path, "data", "telia", "telia1_result.json"),],
+            [("html", "gtt/gtt3.html"), EMAIL_DATE_DATA, (EMAIL_HEADER_SUBJECT, "gtt/gtt3_email_subject")],
+            ["gtt/gtt3_result.json", EMAIL_DATE_RESULT_PATH],
         ),
         (
-            Telia,
-            [("ical", Path(dir_path, "data", "telia", "telia2")),],
-            [Path(dir_path, "data", "telia", "telia2_result.json"),],
+            [("html", "gtt/gtt4.html"), EMAIL_DATE_DATA, (EMAIL_HEADER_SUBJECT, "gtt/gtt4_email_subject")],
+            ["gtt/gtt4_result.json", EMAIL_DATE_RESULT_PATH],
         ),
-        # Telstra
         (
-            Telstra,
-            [
-                ("html", Path(dir_path, "data", "telstra", "telstra1.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "telstra", "telstra1_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
+            [("html", "gtt/gtt5.html"), EMAIL_DATE_DATA, (EMAIL_HEADER_SUBJECT, "gtt/gtt5_email_subject")],
+            ["gtt/gtt5_result.json", EMAIL_DATE_RESULT_PATH],
         ),
         (
-            Telstra,
-            [
-                ("html", Path(dir_path, "data", "telstra", "telstra2.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "telstra", "telstra2_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
+            [("html", "gtt/gtt6.html"), EMAIL_DATE_DATA, (EMAIL_HEADER_SUBJECT, "gtt/gtt6_email_subject")],
+            ["gtt/gtt6_result.json", EMAIL_DATE_RESULT_PATH],
         ),
+        ([("email", "gtt/gtt7.eml")], ["gtt/gtt7_result.json"]),
+    ],
+    HGC: [([("email", "hgc/hgc1.eml"), ("email", "hgc/hgc2.eml")], ["hgc/hgc1_result.json", "hgc/hgc2_result.json"])],
+    Lumen: [
         (
-            Telstra,
-            [
-                ("html", Path(dir_path, "data", "telstra", "telstra3.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "telstra", "telstra3_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
+            [("html", "lumen/lumen1.html"), EMAIL_DATE_DATA, LUMEN_SUBJECT_DATA],
+            ["lumen/lumen1_result.json", EMAIL_DATE_RESULT_PATH],
         ),
         (
-            Telstra,
-            [
-                ("html", Path(dir_path, "data", "telstra", "telstra4.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "telstra", "telstra4_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
+            [("html", "lumen/lumen2.html"), EMAIL_DATE_DATA, LUMEN_SUBJECT_DATA],
+            ["lumen/lumen2_result.json", EMAIL_DATE_RESULT_PATH],
         ),
         (
-            Telstra,
-            [
-                ("html", Path(dir_path, "data", "telstra", "telstra5.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "telstra", "telstra5_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
+            [("html", "lumen/lumen3.html"), EMAIL_DATE_DATA, LUMEN_SUBJECT_DATA],
+            ["lumen/lumen3_result.json", EMAIL_DATE_RESULT_PATH],
         ),
         (
-            Telstra,
-            [
-                ("html", Path(dir_path, "data", "telstra", "telstra6.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "telstra", "telstra6_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
+            [("html", "lumen/lumen4.html"), EMAIL_DATE_DATA, LUMEN_SUBJECT_DATA],
+            ["lumen/lumen4_result.json", EMAIL_DATE_RESULT_PATH],
         ),
-        (Telstra, [("ical", GENERIC_ICAL_DATA_PATH),], [GENERIC_ICAL_RESULT_PATH,],),
-        # Turkcell
+    ],
+    Megaport: [
         (
-            Turkcell,
-            [
-                ("html", Path(dir_path, "data", "turkcell", "turkcell1.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "turkcell", "turkcell1_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
+            [("html", "megaport/megaport1.html"), EMAIL_DATE_DATA],
+            ["megaport/megaport1_result.json", EMAIL_DATE_RESULT_PATH],
         ),
         (
-            Turkcell,
-            [
-                ("html", Path(dir_path, "data", "turkcell", "turkcell2.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "turkcell", "turkcell2_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
+            [("html", "megaport/megaport2.html"), EMAIL_DATE_DATA],
+            ["megaport/megaport2_result.json", EMAIL_DATE_RESULT_PATH],
         ),
-        # Verizon
+    ],
+    Momentum: [([("email", "momentum/momentum1.eml")], ["momentum/momentum1_result.json"])],
+    NTT: [([("ical", "ntt/ntt1")], ["ntt/ntt1_result.json"])],
+    Seaborn: [
+        ([("email", "seaborn/seaborn1.eml")], ["seaborn/seaborn1_result.json"]),
+        ([("email", "seaborn/seaborn2.eml")], ["seaborn/seaborn2_result.json"]),
+        ([("email", "seaborn/seaborn3.eml")], ["seaborn/seaborn3_result.json"]),
+    ],
+    Sparkle: [([("email", "sparkle/sparkle1.eml")], ["sparkle/sparkle1_result.json"])],
+    Telia: [
+        ([("ical", "telia/telia1")], ["telia/telia1_result.json"]),
+        ([("ical", "telia/telia2")], ["telia/telia2_result.json"]),
+    ],
+    Telstra: [
         (
-            Verizon,
-            [
-                ("html", Path(dir_path, "data", "verizon", "verizon1.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "verizon", "verizon1_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
+            [("html", "telstra/telstra1.html"), EMAIL_DATE_DATA],
+            ["telstra/telstra1_result.json", EMAIL_DATE_RESULT_PATH],
         ),
         (
-            Verizon,
-            [
-                ("html", Path(dir_path, "data", "verizon", "verizon2.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "verizon", "verizon2_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
+            [("html", "telstra/telstra2.html"), EMAIL_DATE_DATA],
+            ["telstra/telstra2_result.json", EMAIL_DATE_RESULT_PATH],
         ),
         (
-            Verizon,
-            [
-                ("html", Path(dir_path, "data", "verizon", "verizon3.html")),
-                (EMAIL_HEADER_DATE, Path(dir_path, "data", "date", "email_date_1")),
-            ],
-            [
-                Path(dir_path, "data", "verizon", "verizon3_result.json"),
-                Path(dir_path, "data", "date", "email_date_1_result.json"),
-            ],
+            [("html", "telstra/telstra3.html"), EMAIL_DATE_DATA],
+            ["telstra/telstra3_result.json", EMAIL_DATE_RESULT_PATH],
         ),
-        # Zayo
         (
-            Zayo,
-            [("html", Path(dir_path, "data", "zayo", "zayo1.html")),],
-            [Path(dir_path, "data", "zayo", "zayo1_result.json"),],
+            [("html", "telstra/telstra4.html"), EMAIL_DATE_DATA],
+            ["telstra/telstra4_result.json", EMAIL_DATE_RESULT_PATH],
         ),
         (
-            Zayo,
-            [("html", Path(dir_path, "data", "zayo", "zayo2.html")),],
-            [Path(dir_path, "data", "zayo", "zayo2_result.json"),],
+            [("html", "telstra/telstra5.html"), EMAIL_DATE_DATA],
+            ["telstra/telstra5_result.json", EMAIL_DATE_RESULT_PATH],
         ),
         (
-            Zayo,
-            [("html", Path(dir_path, "data", "zayo", "zayo3.eml")),],
-            [Path(dir_path, "data", "zayo", "zayo3_result.json"),],
+            [("html", "telstra/telstra6.html"), EMAIL_DATE_DATA],
+            ["telstra/telstra6_result.json", EMAIL_DATE_RESULT_PATH],
         ),
+    ],
+    Turkcell: [
         (
-            Zayo,
-            [("email", Path(dir_path, "data", "zayo", "zayo4.eml")),],
-            [Path(dir_path, "data", "zayo", "zayo4_result.json"),],
+            [("html", "turkcell/turkcell1.html"), EMAIL_DATE_DATA],
+            ["turkcell/turkcell1_result.json", EMAIL_DATE_RESULT_PATH],
         ),
         (
-            Zayo,
-            [("email", Path(dir_path, "data", "zayo", "zayo5.eml")),],
-            [Path(dir_path, "data", "zayo", "zayo5_result.json"),],
+            [("html", "turkcell/turkcell2.html"), EMAIL_DATE_DATA],
+            ["turkcell/turkcell2_result.json", EMAIL_DATE_RESULT_PATH],
         ),
+    ],
+    Verizon: [
         (
-            Zayo,
-            [("email", Path(dir_path, "data", "zayo", "zayo6.eml")),],
-            [Path(dir_path, "data", "zayo", "zayo6_result.json"),],
+            [("html", "verizon/verizon1.html"), EMAIL_DATE_DATA],
+            ["verizon/verizon1_result.json", EMAIL_DATE_RESULT_PATH],
         ),
         (
-            Zayo,
-            [("email", Path(dir_path, "data", "zayo", "zayo7.eml")),],
-            [Path(dir_path, "data", "zayo", "zayo7_result.json"),],
+            [("html", "verizon/verizon2.html"), EMAIL_DATE_DATA],
+            ["verizon/verizon2_result.json", EMAIL_DATE_RESULT_PATH],
         ),
         (
-            Zayo,
-            [("email", Path(dir_path, "data", "zayo", "zayo8.eml")),],
-            [Path(dir_path, "data", "zayo", "zayo8_result.json"),],
+            [("html", "verizon/verizon3.html"), EMAIL_DATE_DATA],
+            ["verizon/verizon3_result.json", EMAIL_DATE_RESULT_PATH],
         ),
     ],
-)
+    Zayo: [
+        ([("html", "zayo/zayo1.html")], ["zayo/zayo1_result.json"]),
+        ([("html", "zayo/zayo2.html")], ["zayo/zayo2_result.json"]),
+        ([("html", "zayo/zayo3.eml")], ["zayo/zayo3_result.json"]),
+        ([("email", "zayo/zayo4.eml")], ["zayo/zayo4_result.json"]),
+        ([("email", "zayo/zayo5.eml")], ["zayo/zayo5_result.json"]),
+        ([("email", "zayo/zayo6.eml")], ["zayo/zayo6_result.json"]),
+        ([("email", "zayo/zayo7.eml")], ["zayo/zayo7_result.json"]),
+        ([("email", "zayo/zayo8.eml")], ["zayo/zayo8_result.json"]),
+    ],
+}
+
+
+def _provider_test_cases():
+    """Returns the PROVIDER_TEST_CASES as test parameters, identified by the Provider and the first data file."""
+    return [
+        pytest.param(
+            provider_class,
+            test_data_files,
+            result_parse_files,
+            id=f"{provider_class.__name__}-{Path(test_data_files[0][1]).stem}",
+        )
+        for provider_class, test_cases in PROVIDER_TEST_CASES.items()
+        for test_data_files, result_parse_files in test_cases
+    ]
+
+
+@pytest.mark.parametrize("provider_class, test_data_files, result_parse_files", _provider_test_cases())
 def test_provider_get_maintenances(
     provider_class, test_data_files, result_parse_files
 ):  # pylint: disable=too-many-locals
     """End to End tests for various Providers."""
-    extended_data = provider_class.get_extended_data()
-    default_maintenance_data = {"uid": "0", "sequence": 1, "summary": ""}
-    extended_data.update(default_maintenance_data)
-
-    data = None
-    for data_type, data_file in test_data_files:
-        with open(data_file, "rb") as file_obj:
-            if not data:
-                if data_type in ["ical", "html"]:
-                    data = NotificationData.init_from_raw(data_type, file_obj.read())
-                elif data_type in ["email"]:
-                    data = NotificationData.init_from_email_bytes(file_obj.read())
-            else:
-                data.add_data_part(data_type, file_obj.read())
-
-    parsed_notifications = provider_class().get_maintenances(data)
-    notifications_json = []
-    for parsed_notification in parsed_notifications:
-        notifications_json.append(json.loads(parsed_notification.to_json()))
+    extended_data = {**_get_extended_data(provider_class), **DEFAULT_MAINTENANCE_DATA}
 
-    expected_result = []
-    for result_parse_file in result_parse_files:
-        with open(result_parse_file, encoding="utf-8") as res_file:
-            partial_result_data = json.load(res_file)
-            if not expected_result:
-                expected_result = partial_result_data
-            else:
-                expected_result[0].update(partial_result_data[0])
+    data = NotificationData(data_parts=list(_init_notification_data(*test_data_files[0]).data_parts))
+    for data_type, data_file in test_data_files[1:]:
+        data.add_data_part(data_type, read_data_file(data_file))
+
+    parsed_notifications = get_instance(provider_class).get_maintenances(data)
+    # Status and Impact are str based Enums, so the dict representation can be directly compared with the JSON data
+    notifications_data = [parsed_notification.dict() for parsed_notification in parsed_notifications]
+
+    expected_result = _load_expected_result(result_parse_files)
+    # Data coming from the notification takes precedence over the Provider extended data
+    expected_result = [{**extended_data, **result} for result in expected_result]
+
+    # Comparing each Maintenance independently keeps the assertion diff focused on the mismatching one
+    assert len(notifications_data) == len(expected_result)
+    for notification_data, expected_notification_data in zip(notifications_data, expected_result):
+        assert notification_data == expected_notification_data
+
+
+@pytest.mark.parametrize("provider_class", [GenericProvider, EUNetworks, NTT, PacketFabric, Telstra])
+def test_generic_ical_get_maintenances(provider_class):
+    """End to End tests for the Providers supporting the generic iCal notification format."""
+    extended_data = {**_get_extended_data(provider_class), **DEFAULT_MAINTENANCE_DATA}
+
+    data = _init_notification_data("ical", GENERIC_ICAL_DATA_PATH)
+    parsed_notifications = get_instance(provider_class).get_maintenances(data)
+    notifications_data = [parsed_notification.dict() for parsed_notification in parsed_notifications]
 
-    for result in expected_result:
-        temp_res = result.copy()
-        result.update(extended_data)
-        result.update(temp_res)
+    expected_result = _load_expected_result([GENERIC_ICAL_RESULT_PATH])
+    expected_result = [{**extended_data, **result} for result in expected_result]
 
-    assert notifications_json == expected_result
+    assert len(notifications_data) == len(expected_result)
+    for notification_data, expected_notification_data in zip(notifications_data, expected_result):
+        assert notification_data == expected_notification_data
+
+
+# Error message shared by the generic iCal notifications missing any of the dates, formatted with the missing property
+GENERIC_ICAL_MISSING_DATE_ERROR = """\
+Failed creating Maintenance notification for GenericProvider.
+Details:
+- Processor SimpleProcessor from GenericProvider failed due to: Missing mandatory {} property in VEVENT
+"""
 
 
 @pytest.mark.parametrize(
     "provider_class, data_type, data_file, exception, error_message",
     [
-        (
+        pytest.param(
             GenericProvider,
             "ical",
-            Path(dir_path, "data", "ical", "ical_no_account"),
+            "ical/ical_no_account",
             ProviderError,
             """\
 Failed creating Maintenance notification for GenericProvider.
 Details:
 - Processor SimpleProcessor from GenericProvider failed due to: 1 validation error for Maintenance\naccount\n  field required (type=value_error.missing)
 """,
+            id="GenericProvider-ical_no_account",
         ),
-        (
+        pytest.param(
             GenericProvider,
             "ical",
-            Path(dir_path, "data", "ical", "ical_no_maintenance_id"),
+            "ical/ical_no_maintenance_id",
             ProviderError,
             """\
 Failed creating Maintenance notification for GenericProvider.
@@ -561,44 +327,36 @@ Details:
 maintenance_id
   field required (type=value_error.missing)
 """,
+            id="GenericProvider-ical_no_maintenance_id",
         ),
-        (
+        pytest.param(
             GenericProvider,
             "ical",
-            Path(dir_path, "data", "ical", "ical_no_stamp"),
+            "ical/ical_no_stamp",
             ProviderError,
-            """\
-Failed creating Maintenance notification for GenericProvider.
-Details:
-- Processor SimpleProcessor from GenericProvider failed due to: 'NoneType' object has no attribute 'dt'
-""",
+            GENERIC_ICAL_MISSING_DATE_ERROR.format("DTSTAMP"),
+            id="GenericProvider-ical_no_stamp",
         ),
-        (
+        pytest.param(
             GenericProvider,
             "ical",
-            Path(dir_path, "data", "ical", "ical_no_start"),
+            "ical/ical_no_start",
             ProviderError,
-            """\
-Failed creating Maintenance notification for GenericProvider.
-Details:
-- Processor SimpleProcessor from GenericProvider failed due to: 'NoneType' object has no attribute 'dt'
-""",
+            GENERIC_ICAL_MISSING_DATE_ERROR.format("DTSTART"),
+            id="GenericProvider-ical_no_start",
         ),
-        (
+        pytest.param(
             GenericProvider,
             "ical",
-            Path(dir_path, "data", "ical", "ical_no_end"),
+            "ical/ical_no_end",
             ProviderError,
-            """\
-Failed creating Maintenance notification for GenericProvider.
-Details:
-- Processor SimpleProcessor from GenericProvider failed due to: 'NoneType' object has no attribute 'dt'
-""",
+            GENERIC_ICAL_MISSING_DATE_ERROR.format("DTEND"),
+            id="GenericProvider-ical_no_end",
         ),
-        (
+        pytest.param(
             Telstra,
             "ical",
-            Path(dir_path, "data", "ical", "ical_no_account"),
+            "ical/ical_no_account",
             ProviderError,
             """\
 Failed creating Maintenance notification for Telstra.
@@ -606,12 +364,13 @@ Details:
 - Processor SimpleProcessor from Telstra failed due to: 1 validation error for Maintenance\naccount\n  field required (type=value_error.missing)
 - Processor CombinedProcessor from Telstra failed due to: None of the supported parsers for processor CombinedProcessor (EmailDateParser, HtmlParserTelstra1) was matching any of the provided data types (ical).
 """,
+            id="Telstra-ical_no_account",
         ),
         # Zayo
-        (
+        pytest.param(
             Zayo,
             "html",
-            Path(dir_path, "data", "zayo", "zayo_missing_maintenance_id.html"),
+            "zayo/zayo_missing_maintenance_id.html",
             ProviderError,
             """\
 Failed creating Maintenance notification for Zayo.
@@ -620,11 +379,12 @@ Details:
 maintenance_id
   String is empty or 'None' (type=value_error)
 """,
+            id="Zayo-zayo_missing_maintenance_id",
         ),
-        (
+        pytest.param(
             Zayo,
             "html",
-            Path(dir_path, "data", "zayo", "zayo_bad_html.html"),
+            "zayo/zayo_bad_html.html",
             ProviderError,
             """\
 Failed creating Maintenance notification for Zayo.
@@ -633,24 +393,16 @@ Details:
   - Raw content: b'Maintenance Ticket #: aaa\\n'
   - Result: [{}]
 """,
+            id="Zayo-zayo_bad_html",
         ),
     ],
 )
 def test_errored_provider_process(provider_class, data_type, data_file, exception, error_message):
     """End to End negative tests."""
-    extended_data = provider_class.get_extended_data()
-    # TODO: check how to make data optional from Pydantic do not initialized?
-    default_maintenance_data = {"stamp": None, "uid": "0", "sequence": 1, "summary": ""}
-    extended_data.update(default_maintenance_data)
-
-    with open(data_file, "rb") as file_obj:
-        if data_type in ["ical", "html"]:
-            data = NotificationData.init_from_raw(data_type, file_obj.read())
-        elif data_type in ["email"]:
-            data = NotificationData.init_from_email_bytes(file_obj.read())
+    data = _init_notification_data(data_type, data_file)
 
     with pytest.raises(exception) as exc:
-        provider_class().get_maintenances(data)
+        get_instance(provider_class).get_maintenances(data)
 
     assert len(exc.value.related_exceptions) == len(provider_class._processors)  # pylint: disable=protected-access
     assert str(exc.value) == error_message
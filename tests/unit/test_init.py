@@ -1,6 +1,4 @@
 """Tests for generic parser."""
-import os
-
 import pytest
 
 from circuit_maintenance_parser import (
@@ -14,13 +12,11 @@ from circuit_maintenance_parser.provider import (
     EUNetworks,
     NTT,
     PacketFabric,
+    Seaborn,
     Zayo,
 )
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-
-
 @pytest.mark.parametrize(
     "provider_type, result_type",
     [
@@ -58,7 +54,7 @@ def test_init_provider(provider_type, result_type):
 def test_get_provider_class(provider_name, result, error):
     """Tests for generic parser."""
     if result:
-        assert get_provider_class(provider_name) == result
+        assert get_provider_class(provider_name) is result
     elif error:
         with pytest.raises(error):
             get_provider_class(provider_name)
@@ -71,13 +67,15 @@ def test_get_provider_class(provider_name, result, error):
         (NTT.get_default_organizer(), NTT, None),
         (Zayo.get_default_organizer(), Zayo, None),
         (EUNetworks.get_default_organizer(), EUNetworks, None),
+        # Organizer shared with Turkcell, the first Provider in SUPPORTED_PROVIDERS is returned
+        ("inoc@superonline.net", Seaborn, None),
         ("wrong", None, NonexistentProviderError),
     ],
 )
 def test_get_provider_class_from_email(email_sender, result, error):
     """Tests for parser from email."""
     if result:
-        assert get_provider_class_from_sender(email_sender) == result
+        assert get_provider_class_from_sender(email_sender) is result
     elif error:
         with pytest.raises(error):
             get_provider_class_from_sender(email_sender)
@@ -1,5 +1,5 @@
 """Tests for generic parser."""
-import os
+import json
 
 import pytest
 from pydantic import ValidationError
@@ -7,9 +7,6 @@ from pydantic import ValidationError
 from circuit_maintenance_parser.output import Maintenance, CircuitImpact
 
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-
-
 @pytest.mark.parametrize(
     "attribute, value, exception",
     [
@@ -67,6 +64,15 @@ def test_maintenance_attributes(maintenance_data, attribute, value, exception):
             Maintenance(**maintenance_data)
 
 
+def test_maintenance_to_json(maintenance_data):
+    """Tests the JSON representation of a Maintenance."""
+    maintenance_json = json.loads(Maintenance(**maintenance_data).to_json())
+
+    # Circuits without impact get the default one, and the Enums are represented by their values
+    maintenance_data["circuits"][1]["impact"] = "OUTAGE"
+    assert maintenance_json == maintenance_data
+
+
 @pytest.mark.parametrize(
     "attribute, value, exception",
     [
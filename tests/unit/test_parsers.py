@@ -1,6 +1,5 @@
 """Tests generic for parser."""
 import json
-import os
 from pathlib import Path
 
 import pytest
@@ -30,390 +29,121 @@ from circuit_maintenance_parser.parsers.turkcell import HtmlParserTurkcell1
 from circuit_maintenance_parser.parsers.verizon import HtmlParserVerizon1
 from circuit_maintenance_parser.parsers.zayo import SubjectParserZayo1, HtmlParserZayo1
 
+from .helpers import get_instance, read_data_file
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
 
+# Test cases for the Parsers, defined by the raw data file and the expected result file
+PARSER_TEST_CASES = [
+    # iCal
+    (ICal, "ical/ical1", "ical/ical1_result.json"),
+    (ICal, "ical/ical2", "ical/ical2_result.json"),
+    (ICal, "ical/ical3", "ical/ical3_result.json"),
+    (ICal, "ical/ical4", "ical/ical4_result.json"),
+    (ICal, "ical/ical5", "ical/ical5_result.json"),
+    (ICal, "ical/ical6", "ical/ical6_result.json"),
+    # AquaComms
+    (HtmlParserAquaComms1, "aquacomms/aquacomms1.eml", "aquacomms/aquacomms1_html_parser_result.json"),
+    (SubjectParserAquaComms1, "aquacomms/aquacomms1.eml", "aquacomms/aquacomms1_subject_parser_result.json"),
+    # AWS
+    (TextParserAWS1, "aws/aws1.eml", "aws/aws1_text_parser_result.json"),
+    (SubjectParserAWS1, "aws/aws1.eml", "aws/aws1_subject_parser_result.json"),
+    (TextParserAWS1, "aws/aws2.eml", "aws/aws2_text_parser_result.json"),
+    (SubjectParserAWS1, "aws/aws2.eml", "aws/aws2_subject_parser_result.json"),
+    # Cogent
+    (HtmlParserCogent1, "cogent/cogent1.html", "cogent/cogent1_result.json"),
+    (HtmlParserCogent1, "cogent/cogent2.html", "cogent/cogent2_result.json"),
+    # Colt
+    (CsvParserColt1, "colt/colt2.csv", "colt/colt2_result.json"),
+    (SubjectParserColt1, "colt/colt4.eml", "colt/colt4_subject_parser_1_result.json"),
+    (SubjectParserColt2, "colt/colt5.eml", "colt/colt5_subject_parser_2_result.json"),
+    # Equinix
+    (HtmlParserEquinix, "equinix/equinix1.eml", "equinix/equinix1_result1.json"),
+    (SubjectParserEquinix, "equinix/equinix2.eml", "equinix/equinix2_result.json"),
+    (HtmlParserEquinix, "equinix/equinix3.eml", "equinix/equinix3_result.json"),
+    (HtmlParserEquinix, "equinix/equinix4.eml", "equinix/equinix4_result.json"),
+    # GTT
+    (HtmlParserGTT1, "gtt/gtt1.html", "gtt/gtt1_result.json"),
+    (HtmlParserGTT1, "gtt/gtt2.html", "gtt/gtt2_result.json"),
+    (HtmlParserGTT1, "gtt/gtt3.html", "gtt/gtt3_result.json"),
+    (HtmlParserGTT1, "gtt/gtt4.html", "gtt/gtt4_result.json"),
+    (HtmlParserGTT1, "gtt/gtt5.html", "gtt/gtt5_result.json"),
+    (HtmlParserGTT1, "gtt/gtt6.html", "gtt/gtt6_result.json"),
+    (HtmlParserGTT1, "gtt/gtt7.eml", "gtt/gtt7_html_parser_result.json"),
+    # HGC
+    (HtmlParserHGC1, "hgc/hgc1.eml", "hgc/hgc1_html_result.json"),
+    (HtmlParserHGC2, "hgc/hgc2.eml", "hgc/hgc2_html_result.json"),
+    # Lumen
+    (HtmlParserLumen1, "lumen/lumen1.html", "lumen/lumen1_result.json"),
+    (HtmlParserLumen1, "lumen/lumen2.html", "lumen/lumen2_result.json"),
+    (HtmlParserLumen1, "lumen/lumen3.html", "lumen/lumen3_result.json"),
+    (HtmlParserLumen1, "lumen/lumen4.html", "lumen/lumen4_result.json"),
+    (HtmlParserLumen1, "lumen/lumen5.html", "lumen/lumen5_result.json"),
+    (HtmlParserLumen1, "lumen/lumen6.html", "lumen/lumen6_result.json"),
+    (HtmlParserLumen1, "lumen/lumen7.html", "lumen/lumen7_result.json"),
+    # Megaport
+    (HtmlParserMegaport1, "megaport/megaport1.html", "megaport/megaport1_result.json"),
+    (HtmlParserMegaport1, "megaport/megaport2.html", "megaport/megaport2_result.json"),
+    # Momentum
+    (HtmlParserMomentum1, "momentum/momentum1.eml", "momentum/momentum1_html_parser_result.json"),
+    # NTT
+    (ICal, "ntt/ntt1", "ntt/ntt1_result.json"),
+    # Seaborn
+    (HtmlParserSeaborn1, "seaborn/seaborn3.eml", "seaborn/seaborn3_html_parser_result.json"),
+    (HtmlParserSeaborn2, "seaborn/seaborn2.eml", "seaborn/seaborn2_html_parser_result.json"),
+    (SubjectParserSeaborn1, "seaborn/seaborn3.eml", "seaborn/seaborn3_subject_parser_result.json"),
+    (SubjectParserSeaborn2, "seaborn/seaborn2.eml", "seaborn/seaborn2_subject_parser_result.json"),
+    # Sparkle
+    (HtmlParserSparkle1, "sparkle/sparkle1.eml", "sparkle/sparkle1_html_parser_result.json"),
+    # Telstra
+    (HtmlParserTelstra1, "telstra/telstra1.html", "telstra/telstra1_result.json"),
+    (HtmlParserTelstra1, "telstra/telstra2.html", "telstra/telstra2_result.json"),
+    (HtmlParserTelstra1, "telstra/telstra3.html", "telstra/telstra3_result.json"),
+    (HtmlParserTelstra1, "telstra/telstra4.html", "telstra/telstra4_result.json"),
+    (HtmlParserTelstra1, "telstra/telstra5.html", "telstra/telstra5_result.json"),
+    (HtmlParserTelstra1, "telstra/telstra6.html", "telstra/telstra6_result.json"),
+    (HtmlParserTelstra1, "telstra/telstra7.html", "telstra/telstra7_result.json"),
+    # Turkcell
+    (HtmlParserTurkcell1, "turkcell/turkcell1.html", "turkcell/turkcell1_result.json"),
+    (HtmlParserTurkcell1, "turkcell/turkcell2.html", "turkcell/turkcell2_result.json"),
+    # Verizon
+    (HtmlParserVerizon1, "verizon/verizon1.html", "verizon/verizon1_result.json"),
+    (HtmlParserVerizon1, "verizon/verizon2.html", "verizon/verizon2_result.json"),
+    (HtmlParserVerizon1, "verizon/verizon3.html", "verizon/verizon3_result.json"),
+    (HtmlParserVerizon1, "verizon/verizon4.html", "verizon/verizon4_result.json"),
+    # Zayo
+    (SubjectParserZayo1, "zayo/zayo_subject_1.txt", "zayo/zayo_subject_1_result.json"),
+    (SubjectParserZayo1, "zayo/zayo_subject_2.txt", "zayo/zayo_subject_2_result.json"),
+    (HtmlParserZayo1, "zayo/zayo1.html", "zayo/zayo1_result.json"),
+    (HtmlParserZayo1, "zayo/zayo2.html", "zayo/zayo2_result.json"),
+    (HtmlParserZayo1, "zayo/zayo3.eml", "zayo/zayo3_result.json"),
+    (HtmlParserZayo1, "zayo/zayo4.eml", "zayo/zayo4_html_parser_result.json"),
+    (SubjectParserZayo1, "zayo/zayo4.eml", "zayo/zayo4_subject_parser_result.json"),
+    (HtmlParserZayo1, "zayo/zayo5.eml", "zayo/zayo5_html_parser_result.json"),
+    (SubjectParserZayo1, "zayo/zayo5.eml", "zayo/zayo5_subject_parser_result.json"),
+    (HtmlParserZayo1, "zayo/zayo6.eml", "zayo/zayo6_html_parser_result.json"),
+    (SubjectParserZayo1, "zayo/zayo6.eml", "zayo/zayo6_subject_parser_result.json"),
+    (HtmlParserZayo1, "zayo/zayo7.eml", "zayo/zayo7_html_parser_result.json"),
+    (SubjectParserZayo1, "zayo/zayo7.eml", "zayo/zayo7_subject_parser_result.json"),
+    (HtmlParserZayo1, "zayo/zayo8.eml", "zayo/zayo8_html_parser_result.json"),
+    (SubjectParserZayo1, "zayo/zayo8_subject.txt", "zayo/zayo8_subject_parser_result.json"),
+    # Email Date
+    (EmailDateParser, "date/email_date_1", "date/email_date_1_result.json"),
+]
 
-@pytest.mark.parametrize(
-    "parser_class, raw_file, results_file",
-    [
-        # iCal
-        (ICal, Path(dir_path, "data", "ical", "ical1"), Path(dir_path, "data", "ical", "ical1_result.json"),),
-        (ICal, Path(dir_path, "data", "ical", "ical2"), Path(dir_path, "data", "ical", "ical2_result.json"),),
-        (ICal, Path(dir_path, "data", "ical", "ical3"), Path(dir_path, "data", "ical", "ical3_result.json"),),
-        (ICal, Path(dir_path, "data", "ical", "ical4"), Path(dir_path, "data", "ical", "ical4_result.json"),),
-        (ICal, Path(dir_path, "data", "ical", "ical5"), Path(dir_path, "data", "ical", "ical5_result.json"),),
-        (ICal, Path(dir_path, "data", "ical", "ical6"), Path(dir_path, "data", "ical", "ical6_result.json"),),
-        # AquaComms
-        (
-            HtmlParserAquaComms1,
-            Path(dir_path, "data", "aquacomms", "aquacomms1.eml"),
-            Path(dir_path, "data", "aquacomms", "aquacomms1_html_parser_result.json"),
-        ),
-        (
-            SubjectParserAquaComms1,
-            Path(dir_path, "data", "aquacomms", "aquacomms1.eml"),
-            Path(dir_path, "data", "aquacomms", "aquacomms1_subject_parser_result.json"),
-        ),
-        # AWS
-        (
-            TextParserAWS1,
-            Path(dir_path, "data", "aws", "aws1.eml"),
-            Path(dir_path, "data", "aws", "aws1_text_parser_result.json"),
-        ),
-        (
-            SubjectParserAWS1,
-            Path(dir_path, "data", "aws", "aws1.eml"),
-            Path(dir_path, "data", "aws", "aws1_subject_parser_result.json"),
-        ),
-        (
-            TextParserAWS1,
-            Path(dir_path, "data", "aws", "aws2.eml"),
-            Path(dir_path, "data", "aws", "aws2_text_parser_result.json"),
-        ),
-        (
-            SubjectParserAWS1,
-            Path(dir_path, "data", "aws", "aws2.eml"),
-            Path(dir_path, "data", "aws", "aws2_subject_parser_result.json"),
-        ),
-        # Cogent
-        (
-            HtmlParserCogent1,
-            Path(dir_path, "data", "cogent", "cogent1.html"),
-            Path(dir_path, "data", "cogent", "cogent1_result.json"),
-        ),
-        (
-            HtmlParserCogent1,
-            Path(dir_path, "data", "cogent", "cogent2.html"),
-            Path(dir_path, "data", "cogent", "cogent2_result.json"),
-        ),
-        # Colt
-        (
-            CsvParserColt1,
-            Path(dir_path, "data", "colt", "colt2.csv"),
-            Path(dir_path, "data", "colt", "colt2_result.json"),
-        ),
-        (
-            SubjectParserColt1,
-            Path(dir_path, "data", "colt", "colt4.eml"),
-            Path(dir_path, "data", "colt", "colt4_subject_parser_1_result.json"),
-        ),
-        (
-            SubjectParserColt2,
-            Path(dir_path, "data", "colt", "colt5.eml"),
-            Path(dir_path, "data", "colt", "colt5_subject_parser_2_result.json"),
-        ),
-        # Equinix
-        (
-            HtmlParserEquinix,
-            Path(dir_path, "data", "equinix", "equinix1.eml"),
-            Path(dir_path, "data", "equinix", "equinix1_result1.json"),
-        ),
-        (
-            SubjectParserEquinix,
-            Path(dir_path, "data", "equinix", "equinix2.eml"),
-            Path(dir_path, "data", "equinix", "equinix2_result.json"),
-        ),
-        (
-            HtmlParserEquinix,
-            Path(dir_path, "data", "equinix", "equinix3.eml"),
-            Path(dir_path, "data", "equinix", "equinix3_result.json"),
-        ),
-        (
-            HtmlParserEquinix,
-            Path(dir_path, "data", "equinix", "equinix4.eml"),
-            Path(dir_path, "data", "equinix", "equinix4_result.json"),
-        ),
-        # GTT
-        (
-            HtmlParserGTT1,
-            Path(dir_path, "data", "gtt", "gtt1.html"),
-            Path(dir_path, "data", "gtt", "gtt1_result.json"),
-        ),
-        (
-            HtmlParserGTT1,
-            Path(dir_path, "data", "gtt", "gtt2.html"),
-            Path(dir_path, "data", "gtt", "gtt2_result.json"),
-        ),
-        (
-            HtmlParserGTT1,
-            Path(dir_path, "data", "gtt", "gtt3.html"),
-            Path(dir_path, "data", "gtt", "gtt3_result.json"),
-        ),
-        (
-            HtmlParserGTT1,
-            Path(dir_path, "data", "gtt", "gtt4.html"),
-            Path(dir_path, "data", "gtt", "gtt4_result.json"),
-        ),
-        (
-            HtmlParserGTT1,
-            Path(dir_path, "data", "gtt", "gtt5.html"),
-            Path(dir_path, "data", "gtt", "gtt5_result.json"),
-        ),
-        (
-            HtmlParserGTT1,
-            Path(dir_path, "data", "gtt", "gtt6.html"),
-            Path(dir_path, "data", "gtt", "gtt6_result.json"),
-        ),
-        (
-            HtmlParserGTT1,
-            Path(dir_path, "data", "gtt", "gtt7.eml"),
-            Path(dir_path, "data", "gtt", "gtt7_html_parser_result.json"),
-        ),
-        # HGC
-        (
-            HtmlParserHGC1,
-            Path(dir_path, "data", "hgc", "hgc1.eml"),
-            Path(dir_path, "data", "hgc", "hgc1_html_result.json"),
-        ),
-        (
-            HtmlParserHGC2,
-            Path(dir_path, "data", "hgc", "hgc2.eml"),
-            Path(dir_path, "data", "hgc", "hgc2_html_result.json"),
-        ),
-        # Lumen
-        (
-            HtmlParserLumen1,
-            Path(dir_path, "data", "lumen", "lumen1.html"),
-            Path(dir_path, "data", "lumen", "lumen1_result.json"),
-        ),
-        (
-            HtmlParserLumen1,
-            Path(dir_path, "data", "lumen", "lumen2.html"),
-            Path(dir_path, "data", "lumen", "lumen2_result.json"),
-        ),
-        (
-            HtmlParserLumen1,
-            Path(dir_path, "data", "lumen", "lumen3.html"),
-            Path(dir_path, "data", "lumen", "lumen3_result.json"),
-        ),
-        (
-            HtmlParserLumen1,
-            Path(dir_path, "data", "lumen", "lumen4.html"),
-            Path(dir_path, "data", "lumen", "lumen4_result.json"),
-        ),
-        (
-            HtmlParserLumen1,
-            Path(dir_path, "data", "lumen", "lumen5.html"),
-            Path(dir_path, "data", "lumen", "lumen5_result.json"),
-        ),
-        (
-            HtmlParserLumen1,
-            Path(dir_path, "data", "lumen", "lumen6.html"),
-            Path(dir_path, "data", "lumen", "lumen6_result.json"),
-        ),
-        (
-            HtmlParserLumen1,
-            Path(dir_path, "data", "lumen", "lumen7.html"),
-            Path(dir_path, "data", "lumen", "lumen7_result.json"),
-        ),
-        # Megaport
-        (
-            HtmlParserMegaport1,
-            Path(dir_path, "data", "megaport", "megaport1.html"),
-            Path(dir_path, "data", "megaport", "megaport1_result.json"),
-        ),
-        (
-            HtmlParserMegaport1,
-            Path(dir_path, "data", "megaport", "megaport2.html"),
-            Path(dir_path, "data", "megaport", "megaport2_result.json"),
-        ),
-        # Momentum
-        (
-            HtmlParserMomentum1,
-            Path(dir_path, "data", "momentum", "momentum1.eml"),
-            Path(dir_path, "data", "momentum", "momentum1_html_parser_result.json"),
-        ),
-        # NTT
-        (ICal, Path(dir_path, "data", "ntt", "ntt1"), Path(dir_path, "data", "ntt", "ntt1_result.json"),),
-        # Seaborn
-        (
-            HtmlParserSeaborn1,
-            Path(dir_path, "data", "seaborn", "seaborn3.eml"),
-            Path(dir_path, "data", "seaborn", "seaborn3_html_parser_result.json"),
-        ),
-        (
-            HtmlParserSeaborn2,
-            Path(dir_path, "data", "seaborn", "seaborn2.eml"),
-            Path(dir_path, "data", "seaborn", "seaborn2_html_parser_result.json"),
-        ),
-        (
-            SubjectParserSeaborn1,
-            Path(dir_path, "data", "seaborn", "seaborn3.eml"),
-            Path(dir_path, "data", "seaborn", "seaborn3_subject_parser_result.json"),
-        ),
-        (
-            SubjectParserSeaborn2,
-            Path(dir_path, "data", "seaborn", "seaborn2.eml"),
-            Path(dir_path, "data", "seaborn", "seaborn2_subject_parser_result.json"),
-        ),
-        # Sparkle
-        (
-            HtmlParserSparkle1,
-            Path(dir_path, "data", "sparkle", "sparkle1.eml"),
-            Path(dir_path, "data", "sparkle", "sparkle1_html_parser_result.json"),
-        ),
-        # Telstra
-        (
-            HtmlParserTelstra1,
-            Path(dir_path, "data", "telstra", "telstra1.html"),
-            Path(dir_path, "data", "telstra", "telstra1_result.json"),
-        ),
-        (
-            HtmlParserTelstra1,
-            Path(dir_path, "data", "telstra", "telstra2.html"),
-            Path(dir_path, "data", "telstra", "telstra2_result.json"),
-        ),
-        (
-            HtmlParserTelstra1,
-            Path(dir_path, "data", "telstra", "telstra3.html"),
-            Path(dir_path, "data", "telstra", "telstra3_result.json"),
-        ),
-        (
-            HtmlParserTelstra1,
-            Path(dir_path, "data", "telstra", "telstra4.html"),
-            Path(dir_path, "data", "telstra", "telstra4_result.json"),
-        ),
-        (
-            HtmlParserTelstra1,
-            Path(dir_path, "data", "telstra", "telstra5.html"),
-            Path(dir_path, "data", "telstra", "telstra5_result.json"),
-        ),
-        (
-            HtmlParserTelstra1,
-            Path(dir_path, "data", "telstra", "telstra6.html"),
-            Path(dir_path, "data", "telstra", "telstra6_result.json"),
-        ),
-        (
-            HtmlParserTelstra1,
-            Path(dir_path, "data", "telstra", "telstra7.html"),
-            Path(dir_path, "data", "telstra", "telstra7_result.json"),
-        ),
-        # Turkcell
-        (
-            HtmlParserTurkcell1,
-            Path(dir_path, "data", "turkcell", "turkcell1.html"),
-            Path(dir_path, "data", "turkcell", "turkcell1_result.json"),
-        ),
-        (
-            HtmlParserTurkcell1,
-            Path(dir_path, "data", "turkcell", "turkcell2.html"),
-            Path(dir_path, "data", "turkcell", "turkcell2_result.json"),
-        ),
-        # Verizon
-        (
-            HtmlParserVerizon1,
-            Path(dir_path, "data", "verizon", "verizon1.html"),
-            Path(dir_path, "data", "verizon", "verizon1_result.json"),
-        ),
-        (
-            HtmlParserVerizon1,
-            Path(dir_path, "data", "verizon", "verizon2.html"),
-            Path(dir_path, "data", "verizon", "verizon2_result.json"),
-        ),
-        (
-            HtmlParserVerizon1,
-            Path(dir_path, "data", "verizon", "verizon3.html"),
-            Path(dir_path, "data", "verizon", "verizon3_result.json"),
-        ),
-        (
-            HtmlParserVerizon1,
-            Path(dir_path, "data", "verizon", "verizon4.html"),
-            Path(dir_path, "data", "verizon", "verizon4_result.json"),
-        ),
-        # Zayo
-        (
-            SubjectParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo_subject_1.txt"),
-            Path(dir_path, "data", "zayo", "zayo_subject_1_result.json"),
-        ),
-        (
-            SubjectParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo_subject_2.txt"),
-            Path(dir_path, "data", "zayo", "zayo_subject_2_result.json"),
-        ),
-        (
-            HtmlParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo1.html"),
-            Path(dir_path, "data", "zayo", "zayo1_result.json"),
-        ),
-        (
-            HtmlParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo2.html"),
-            Path(dir_path, "data", "zayo", "zayo2_result.json"),
-        ),
-        (
-            HtmlParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo3.eml"),
-            Path(dir_path, "data", "zayo", "zayo3_result.json"),
-        ),
-        (
-            HtmlParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo4.eml"),
-            Path(dir_path, "data", "zayo", "zayo4_html_parser_result.json"),
-        ),
-        (
-            SubjectParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo4.eml"),
-            Path(dir_path, "data", "zayo", "zayo4_subject_parser_result.json"),
-        ),
-        (
-            HtmlParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo5.eml"),
-            Path(dir_path, "data", "zayo", "zayo5_html_parser_result.json"),
-        ),
-        (
-            SubjectParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo5.eml"),
-            Path(dir_path, "data", "zayo", "zayo5_subject_parser_result.json"),
-        ),
-        (
-            HtmlParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo6.eml"),
-            Path(dir_path, "data", "zayo", "zayo6_html_parser_result.json"),
-        ),
-        (
-            SubjectParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo6.eml"),
-            Path(dir_path, "data", "zayo", "zayo6_subject_parser_result.json"),
-        ),
-        (
-            HtmlParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo7.eml"),
-            Path(dir_path, "data", "zayo", "zayo7_html_parser_result.json"),
-        ),
-        (
-            SubjectParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo7.eml"),
-            Path(dir_path, "data", "zayo", "zayo7_subject_parser_result.json"),
-        ),
-        (
-            HtmlParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo8.eml"),
-            Path(dir_path, "data", "zayo", "zayo8_html_parser_result.json"),
-        ),
-        (
-            SubjectParserZayo1,
-            Path(dir_path, "data", "zayo", "zayo8_subject.txt"),
-            Path(dir_path, "data", "zayo", "zayo8_subject_parser_result.json"),
-        ),
-        # Email Date
-        (
-            EmailDateParser,
-            Path(dir_path, "data", "date", "email_date_1"),
-            Path(dir_path, "data", "date", "email_date_1_result.json"),
-        ),
-    ],
-)
-def test_parsers(parser_class, raw_file, results_file):
-    """Tests various parser."""
-    with open(raw_file, "rb") as file_obj:
-        raw_data = file_obj.read()
 
-    parsed_notifications = parser_class().parse(raw_data)
+def _parser_test_cases():
+    """Returns the PARSER_TEST_CASES as test parameters, identified by the Parser and the raw data file."""
+    return [
+        pytest.param(parser_class, raw_file, results_file, id=f"{parser_class.__name__}-{Path(raw_file).stem}")
+        for parser_class, raw_file, results_file in PARSER_TEST_CASES
+    ]
 
-    with open(results_file, encoding="utf-8") as res_file:
-        expected_result = json.load(res_file)
+
+@pytest.mark.parametrize("parser_class, raw_file, results_file", _parser_test_cases())
+def test_parsers(parser_class, raw_file, results_file):
+    """Tests various parser."""
+    parsed_notifications = get_instance(parser_class).parse(read_data_file(raw_file))
+    expected_result = json.loads(read_data_file(results_file))
 
     assert parsed_notifications == expected_result
 
@@ -422,4 +152,4 @@ def test_parsers(parser_class, raw_file, results_file):
 def test_parser_no_data(parser_class):
     """Test parser with no data."""
     with pytest.raises(ParserError):
-        parser_class().parse(b"")
+        get_instance(parser_class).parse(b"")
@@ -1,6 +1,5 @@
 """Tests for Processor."""
-import copy
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 import pytest
 from pydantic.error_wrappers import ValidationError
@@ -16,6 +15,8 @@ from circuit_maintenance_parser.parser import Parser
 
 PARSED_DATA = [{"a": "b"}, {"c": "d"}]
 EXTENDED_DATA = {"y": "z"}
+# Maintenance data expected from the CombinedProcessor using FakeParser0 and FakeParser1
+COMBINED_DATA = {**PARSED_DATA[0], **PARSED_DATA[1], **EXTENDED_DATA}
 
 
 class FakeParser(Parser):
@@ -28,7 +29,8 @@ class FakeParser(Parser):
         return [cls._data_type]
 
     def parse(self, *args, **kwargs):  # pylint: disable=unused-argument
-        return copy.deepcopy(self._parsed_data)
+        # Processors extend the parsed data in place, so each call returns new dicts
+        return [dict(parsed_data) for parsed_data in self._parsed_data]
 
     def parser_hook(self, raw: bytes):
         pass
@@ -37,89 +39,100 @@ class FakeParser(Parser):
 class FakeParser0(FakeParser):
     "Fake class to simulate another Parser."
     _data_type = "fake_type_0"
-    _parsed_data = copy.deepcopy([PARSED_DATA[0]])
+    _parsed_data = [PARSED_DATA[0]]
 
 
 class FakeParser1(FakeParser):
     "Fake class to simulate yet another Parser."
     _data_type = "fake_type_1"
-    _parsed_data = copy.deepcopy([PARSED_DATA[1]])
+    _parsed_data = [PARSED_DATA[1]]
 
 
-# Fake data used for SimpleProcessor
-fake_data = NotificationData.init_from_raw("fake_type", b"fake data")
-# Fake data used for CombinedProcessor
-fake_data_type_0 = NotificationData.init_from_raw("fake_type_0", b"fake data")
-fake_data_for_combined = NotificationData.init_from_raw("fake_type_0", b"fake data")
-if fake_data_for_combined:
-    fake_data_for_combined.data_parts.append(DataPart("fake_type_1", b"fake data"))
+@pytest.fixture(name="fake_data", scope="module")
+def fixture_fake_data():
+    """Fake data used for SimpleProcessor."""
+    return NotificationData.init_from_raw("fake_type", b"fake data")
 
 
-def test_simpleprocessor():
+@pytest.fixture(name="fake_data_type_0", scope="module")
+def fixture_fake_data_type_0():
+    """Fake data used for CombinedProcessor, only matching FakeParser0."""
+    return NotificationData.init_from_raw("fake_type_0", b"fake data")
+
+
+@pytest.fixture(name="fake_data_for_combined", scope="module")
+def fixture_fake_data_for_combined():
+    """Fake data used for CombinedProcessor, matching FakeParser0 and FakeParser1."""
+    return NotificationData(data_parts=[DataPart("fake_type_0", b"fake data"), DataPart("fake_type_1", b"fake data")])
+
+
+@pytest.fixture(name="mock_maintenance")
+def fixture_mock_maintenance():
+    """Replaces the Maintenance class used by the processors, so the fake parsed data doesn't need to be valid."""
+    with patch("circuit_maintenance_parser.processor.Maintenance") as mock:
+        yield mock
+
+
+def test_simpleprocessor(mock_maintenance, fake_data):
     """Tests SimpleProcessor."""
     processor = SimpleProcessor(data_parsers=[FakeParser])
 
-    with patch("circuit_maintenance_parser.processor.Maintenance") as mock_maintenance:
-        processor.process(fake_data, EXTENDED_DATA)
-        assert mock_maintenance.call_count == len(PARSED_DATA)
-        for parsed_data_element in PARSED_DATA:
-            parsed_data_element.update(EXTENDED_DATA)
-            mock_maintenance.assert_any_call(**parsed_data_element)
+    processor.process(fake_data, EXTENDED_DATA)
+    assert mock_maintenance.call_count == len(PARSED_DATA)
+    mock_maintenance.assert_has_calls(
+        [call(**{**parsed_data_element, **EXTENDED_DATA}) for parsed_data_element in PARSED_DATA], any_order=True
+    )
 
 
-def test_simpleprocessor_without_matching_type():
+def test_simpleprocessor_without_matching_type(fake_data_for_combined):
     """Tests SimpleProcessor without matching data types."""
     processor = SimpleProcessor(data_parsers=[FakeParser])
     with pytest.raises(ProcessorError) as e_info:
         processor.process(fake_data_for_combined, EXTENDED_DATA)
-    assert "None of the supported parsers for processor SimpleProcessor (FakeParser)" in str(e_info)
+    assert "None of the supported parsers for processor SimpleProcessor (FakeParser)" in str(e_info.value)
 
 
-def test_combinedprocessor_multiple_data():
+def test_combinedprocessor_multiple_data(mock_maintenance, fake_data):
     """Tests CombinedProcessor wrong parsed data, with multiple entities."""
     processor = CombinedProcessor(data_parsers=[FakeParser])
 
-    with patch("circuit_maintenance_parser.processor.Maintenance") as mock_maintenance:
-        processor.process(fake_data, EXTENDED_DATA)
-        assert mock_maintenance.call_count == len(PARSED_DATA)
-        for parsed_data_element in PARSED_DATA:
-            parsed_data_element.update(EXTENDED_DATA)
-            mock_maintenance.assert_any_call(**parsed_data_element)
+    processor.process(fake_data, EXTENDED_DATA)
+    assert mock_maintenance.call_count == len(PARSED_DATA)
+    mock_maintenance.assert_has_calls(
+        [call(**{**parsed_data_element, **EXTENDED_DATA}) for parsed_data_element in PARSED_DATA], any_order=True
+    )
 
 
-def test_combinedprocessor():
+def test_combinedprocessor(mock_maintenance, fake_data_for_combined):
     """Tests CombinedProcessor."""
     processor = CombinedProcessor(data_parsers=[FakeParser0, FakeParser1])
 
-    with patch("circuit_maintenance_parser.processor.Maintenance") as mock_maintenance:
-        processor.process(fake_data_for_combined, EXTENDED_DATA)
-        assert mock_maintenance.call_count == 1
-        mock_maintenance.assert_any_call(**{**PARSED_DATA[0], **PARSED_DATA[1], **EXTENDED_DATA})
+    processor.process(fake_data_for_combined, EXTENDED_DATA)
+    assert mock_maintenance.call_count == 1
+    mock_maintenance.assert_any_call(**COMBINED_DATA)
 
 
-def test_combinedprocessor_missing_data():
+def test_combinedprocessor_missing_data(mock_maintenance, fake_data_for_combined):
     """Tests CombinedProcessor when there is not enough info to create a Maintenance."""
     processor = CombinedProcessor(data_parsers=[FakeParser0, FakeParser1])
 
-    with patch("circuit_maintenance_parser.processor.Maintenance") as mock_maintenance:
-        mock_maintenance.side_effect = ValidationError(errors=["whatever"], model=Maintenance)
-        with pytest.raises(ProcessorError) as e_info:
-            # Using the fake_data that returns mutliple maintenances that are not expected in this processor type
-            processor.process(fake_data_for_combined, EXTENDED_DATA)
+    mock_maintenance.side_effect = ValidationError(errors=["whatever"], model=Maintenance)
+    with pytest.raises(ProcessorError) as e_info:
+        # Using the fake_data that returns mutliple maintenances that are not expected in this processor type
+        processor.process(fake_data_for_combined, EXTENDED_DATA)
 
-        assert "Not enough information available to create a Maintenance notification" in str(e_info)
+    assert "Not enough information available to create a Maintenance notification" in str(e_info.value)
 
 
-def test_combinedprocessor_bleed():
+def test_combinedprocessor_bleed(mock_maintenance, fake_data_type_0, fake_data_for_combined):
     """Test CombinedProcessor to make sure that information from one processing doesn't bleed over to another."""
     processor = CombinedProcessor(data_parsers=[FakeParser0, FakeParser1])
 
-    with patch("circuit_maintenance_parser.processor.Maintenance") as mock_maintenance:
-        processor.process(fake_data_for_combined, EXTENDED_DATA)
-        assert mock_maintenance.call_count == 1
-        mock_maintenance.assert_called_with(**{**PARSED_DATA[0], **PARSED_DATA[1], **EXTENDED_DATA})
+    processor.process(fake_data_for_combined, EXTENDED_DATA)
+    assert mock_maintenance.call_count == 1
+    mock_maintenance.assert_called_with(**COMBINED_DATA)
 
-    with patch("circuit_maintenance_parser.processor.Maintenance") as mock_maintenance:
-        processor.process(fake_data_type_0, EXTENDED_DATA)
-        assert mock_maintenance.call_count == 1
-        mock_maintenance.assert_called_with(**{**PARSED_DATA[0], **EXTENDED_DATA})
+    mock_maintenance.reset_mock()
+    processor.process(fake_data_type_0, EXTENDED_DATA)
+    assert mock_maintenance.call_count == 1
+    mock_maintenance.assert_called_with(**{**PARSED_DATA[0], **EXTENDED_DATA})
@@ -5,12 +5,14 @@ import pytest
 
 from circuit_maintenance_parser.data import NotificationData
 from circuit_maintenance_parser.errors import ProcessorError, ProviderError
-from circuit_maintenance_parser.processor import SimpleProcessor
+from circuit_maintenance_parser.processor import GenericProcessor, SimpleProcessor
 from circuit_maintenance_parser.provider import GenericProvider
 from circuit_maintenance_parser.parser import Parser
 
 # pylint: disable=use-implicit-booleaness-not-comparison
-fake_data = NotificationData.init_from_raw("fake_type", b"fake data")
+
+FAKE_DATA_TYPE = "fake_type"
+FAKE_DATA_CONTENT = "fake data"
 
 
 class ProviderWithOneProcessor(GenericProvider):
@@ -26,44 +28,55 @@ class ProviderWithTwoProcessors(GenericProvider):
     ]
 
 
+@pytest.fixture(name="fake_data", scope="module")
+def fixture_fake_data():
+    """Fake data used for the Providers."""
+    return NotificationData.init_from_raw(FAKE_DATA_TYPE, FAKE_DATA_CONTENT.encode())
+
+
+@pytest.fixture(name="mock_processor")
+def fixture_mock_processor():
+    """Replaces the process method of the Processors used by the Providers."""
+    with patch.object(GenericProcessor, "process") as mock:
+        yield mock
+
+
 @pytest.mark.parametrize(
     "provider_class", [ProviderWithOneProcessor, ProviderWithTwoProcessors],
 )
-def test_provide_get_maintenances(provider_class):
+def test_provide_get_maintenances(provider_class, fake_data, mock_processor):
     """Tests GenericProvider."""
     provider = provider_class()
 
-    with patch("circuit_maintenance_parser.provider.GenericProcessor.process") as mock_processor:
-        provider.get_maintenances(fake_data)
-        assert mock_processor.call_count == 1
+    provider.get_maintenances(fake_data)
+    assert mock_processor.call_count == 1
 
 
 @pytest.mark.parametrize(
     "provider_class", [ProviderWithOneProcessor, ProviderWithTwoProcessors],
 )
-def test_provide_get_maintenances_one_exception(provider_class):
+def test_provide_get_maintenances_one_exception(provider_class, fake_data, mock_processor):
     """Tests GenericProvider."""
     provider = provider_class()
 
-    with patch("circuit_maintenance_parser.provider.GenericProcessor.process") as mock_processor:
-        mock_processor.side_effect = [ProcessorError, ""]
-        if len(provider._processors) < 2:  # pylint: disable=protected-access
-            with pytest.raises(ProviderError) as ex_info:
-                provider.get_maintenances(fake_data)
-            assert "Failed creating Maintenance notification for" in str(ex_info)
-
-        else:
+    mock_processor.side_effect = [ProcessorError, ""]
+    if len(provider._processors) < 2:  # pylint: disable=protected-access
+        with pytest.raises(ProviderError) as ex_info:
             provider.get_maintenances(fake_data)
-            assert mock_processor.call_count == 2
+        assert "Failed creating Maintenance notification for" in str(ex_info.value)
+
+    else:
+        provider.get_maintenances(fake_data)
+        assert mock_processor.call_count == 2
 
 
-def test_provider_with_include_filter():
+def test_provider_with_include_filter(fake_data):
     """Tests usage of _include_filter."""
 
     class ProviderWithIncludeFilter(GenericProvider):
         """Fake Provider."""
 
-        _include_filter = {fake_data.data_parts[0].type: [fake_data.data_parts[0].content.decode()]}
+        _include_filter = {FAKE_DATA_TYPE: [FAKE_DATA_CONTENT]}
 
     # Because the include filter is matching with the data, we expect that we hit the `process`
     with pytest.raises(ProviderError):
@@ -74,13 +87,13 @@ def test_provider_with_include_filter():
     assert ProviderWithIncludeFilter().get_maintenances(other_fake_data) == []
 
 
-def test_provider_with_exclude_filter():
+def test_provider_with_exclude_filter(fake_data):
     """Tests usage of _exclude_filter."""
 
     class ProviderWithIncludeFilter(GenericProvider):
         """Fake Provider."""
 
-        _exclude_filter = {fake_data.data_parts[0].type: [fake_data.data_parts[0].content.decode()]}
+        _exclude_filter = {FAKE_DATA_TYPE: [FAKE_DATA_CONTENT]}
 
     # Because the exclude filter is matching with the data, we expect that we skip the processing
     assert ProviderWithIncludeFilter().get_maintenances(fake_data) == []
@@ -1,10 +1,15 @@
 """Tests for parser utils."""
+from unittest.mock import patch
 
 import pytest
 
 from circuit_maintenance_parser.utils import Geolocator
 
-geolocator = Geolocator()
+
+@pytest.fixture(name="geolocator", scope="session")
+def fixture_geolocator():
+    """Geolocator shared by the timezone tests."""
+    return Geolocator()
 
 
 @pytest.mark.parametrize(
@@ -24,6 +29,26 @@ geolocator = Geolocator()
         ("Guadalajara, Mexico", "America/Mexico_City"),
     ],
 )
-def test_city_timezones(city, timezone):
+def test_city_timezones(geolocator, city, timezone):
     """Tests for utility timezone function."""
     assert geolocator.city_timezone(city) == timezone
+
+
+def test_city_timezone_cached(geolocator, monkeypatch):
+    """Tests that the timezone of an already resolved city is not resolved again."""
+    monkeypatch.setattr(Geolocator, "_city_timezones", {})
+
+    with patch.object(Geolocator, "get_location", return_value=(41.38879, 2.15899)) as mock_get_location:
+        assert geolocator.city_timezone("Barcelona, Spain") == "Europe/Madrid"
+        assert geolocator.city_timezone("Barcelona, Spain") == "Europe/Madrid"
+        assert mock_get_location.call_count == 1
+
+
+def test_city_timezone_cache_size(geolocator, monkeypatch):
+    """Tests that the oldest resolved city is evicted when the cache is full."""
+    monkeypatch.setattr(Geolocator, "_city_timezones", {})
+    monkeypatch.setattr(Geolocator, "_city_timezones_max_size", 1)
+
+    geolocator.city_timezone("Barcelona, Spain")
+    geolocator.city_timezone("Dublin, Ireland")
+    assert Geolocator._city_timezones == {"Dublin, Ireland": "Europe/Dublin"}  # pylint: disable=protected-access